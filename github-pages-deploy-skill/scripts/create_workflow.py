@@ -4,225 +4,134 @@ Create GitHub Actions workflow for deploying to GitHub Pages.
 Supports multiple project types: vanilla, react-vite, cra, vue, nextjs.
 """
 
+import functools
+import io
 import os
 import sys
 from pathlib import Path
 
+from ruamel.yaml import YAML
+
+PROJECT_TYPES = ("vanilla", "react-vite", "cra", "vue", "nextjs")
+
+_ARTIFACT_PATHS = {
+    "vanilla": ".",
+    "react-vite": "dist",
+    "cra": "build",
+    "vue": "dist",
+    "nextjs": "out",
+}
+
+_CACHE_PATHS = {
+    "react-vite": ["~/.npm", "node_modules", "node_modules/.vite"],
+    "cra": ["~/.npm", "node_modules"],
+    "vue": ["~/.npm", "node_modules", "node_modules/.vite"],
+    "nextjs": ["~/.npm", "node_modules", ".next/cache"],
+}
+
+_BUILD_ENV_VARS = {
+    "react-vite": "VITE_BASE_URL",
+    "cra": "PUBLIC_URL",
+}
+
+# Shared trigger/permission blocks exist once; jobs are composed per type
+_BASE = {
+    "name": "Deploy to GitHub Pages",
+    "on": {"push": {"branches": ["main"]}},
+    "permissions": {"contents": "write", "pages": "write", "id-token": "write"},
+}
+
+_yaml = YAML(typ="safe")
+_yaml.default_flow_style = False
+_yaml.sort_base_mapping_type_on_output = False
+
+
+def _build_steps(project_type, repo_name):
+    """Compose the job's step list for the given project type."""
+    steps = [{"uses": "actions/checkout@v4"}]
+
+    if project_type != "vanilla":
+        steps.append({
+            "name": "Setup Node.js",
+            "uses": "actions/setup-node@v4",
+            "with": {"node-version": "20", "cache": "npm"},
+        })
+        steps.append({
+            "name": "Cache build outputs",
+            "uses": "actions/cache@v4",
+            "with": {
+                "path": "\n".join(_CACHE_PATHS[project_type]),
+                "key": "${{ runner.os }}-build-${{ hashFiles('**/package-lock.json') }}",
+                "restore-keys": "${{ runner.os }}-build-",
+            },
+        })
+        steps.append({
+            "name": "Install dependencies",
+            "run": "npm ci --prefer-offline --no-audit --no-fund",
+        })
+        build = {"name": "Build", "run": "npm run build"}
+        env_var = _BUILD_ENV_VARS.get(project_type)
+        if env_var:
+            build["env"] = {env_var: f"/{repo_name}/"}
+        steps.append(build)
+
+    steps.append({"name": "Setup Pages", "uses": "actions/configure-pages@v4"})
+    steps.append({
+        "name": "Upload artifact",
+        "uses": "actions/upload-pages-artifact@v3",
+        "with": {"path": _ARTIFACT_PATHS[project_type]},
+    })
+    steps.append({
+        "name": "Deploy to GitHub Pages",
+        "id": "deployment",
+        "uses": "actions/deploy-pages@v4",
+    })
+    return steps
+
+
+def _render_workflow(project_type, repo_name):
+    """Dump the composed workflow dict to canonical YAML bytes."""
+    job_name = "deploy" if project_type == "vanilla" else "build-and-deploy"
+    doc = dict(_BASE)
+    doc["jobs"] = {
+        job_name: {
+            "runs-on": "ubuntu-latest",
+            "steps": _build_steps(project_type, repo_name),
+        }
+    }
+    out = io.BytesIO()
+    _yaml.dump(doc, out)
+    return out.getvalue()
+
+
+# Dump each project type once at import with a sentinel repo name and split
+# into a (prefix, suffix) bytes pair; types with no repo_name reference keep
+# a single frozen bytes object. The sentinel must survive the YAML dumper
+# verbatim, so it is plain text rather than control characters.
+_REPO_SENTINEL = b"@@REPO_NAME@@"
+_WORKFLOWS = {}
+for _pt in PROJECT_TYPES:
+    _rendered = _render_workflow(_pt, _REPO_SENTINEL.decode("ascii"))
+    if _REPO_SENTINEL in _rendered:
+        _prefix, _suffix = _rendered.split(_REPO_SENTINEL)
+        _WORKFLOWS[_pt] = (_prefix, _suffix)
+    else:
+        _WORKFLOWS[_pt] = _rendered
+
 
+@functools.lru_cache(maxsize=128)
 def get_workflow_template(project_type, repo_name, build_dir=None):
-    """Get workflow template based on project type."""
-
-    if project_type == "vanilla":
-        workflow = '''name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [ main ]
-
-permissions:
-  contents: write
-  pages: write
-  id-token: write
-
-jobs:
-  deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Setup Pages
-        uses: actions/configure-pages@v4
-
-      - name: Upload artifact
-        uses: actions/upload-pages-artifact@v3
-        with:
-          path: '.'
-
-      - name: Deploy to GitHub Pages
-        id: deployment
-        uses: actions/deploy-pages@v4
-'''
-
-    elif project_type == "react-vite":
-        workflow = f'''name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [ main ]
-
-permissions:
-  contents: write
-  pages: write
-  id-token: write
-
-jobs:
-  build-and-deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: '20'
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
-
-      - name: Build
-        run: npm run build
-        env:
-          VITE_BASE_URL: /{repo_name}/
-
-      - name: Setup Pages
-        uses: actions/configure-pages@v4
-
-      - name: Upload artifact
-        uses: actions/upload-pages-artifact@v3
-        with:
-          path: dist
-
-      - name: Deploy to GitHub Pages
-        id: deployment
-        uses: actions/deploy-pages@v4
-'''
-
-    elif project_type == "cra":
-        workflow = f'''name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [ main ]
-
-permissions:
-  contents: write
-  pages: write
-  id-token: write
-
-jobs:
-  build-and-deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: '20'
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
-
-      - name: Build
-        run: npm run build
-        env:
-          PUBLIC_URL: /{repo_name}/
-
-      - name: Setup Pages
-        uses: actions/configure-pages@v4
-
-      - name: Upload artifact
-        uses: actions/upload-pages-artifact@v3
-        with:
-          path: build
-
-      - name: Deploy to GitHub Pages
-        id: deployment
-        uses: actions/deploy-pages@v4
-'''
-
-    elif project_type == "vue":
-        workflow = f'''name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [ main ]
-
-permissions:
-  contents: write
-  pages: write
-  id-token: write
-
-jobs:
-  build-and-deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: '20'
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
-
-      - name: Build
-        run: npm run build
-
-      - name: Setup Pages
-        uses: actions/configure-pages@v4
-
-      - name: Upload artifact
-        uses: actions/upload-pages-artifact@v3
-        with:
-          path: dist
-
-      - name: Deploy to GitHub Pages
-        id: deployment
-        uses: actions/deploy-pages@v4
-'''
-
-    elif project_type == "nextjs":
-        workflow = f'''name: Deploy to GitHub Pages
-
-on:
-  push:
-    branches: [ main ]
-
-permissions:
-  contents: write
-  pages: write
-  id-token: write
-
-jobs:
-  build-and-deploy:
-    runs-on: ubuntu-latest
-    steps:
-      - uses: actions/checkout@v4
-
-      - name: Setup Node.js
-        uses: actions/setup-node@v4
-        with:
-          node-version: '20'
-          cache: 'npm'
-
-      - name: Install dependencies
-        run: npm ci
-
-      - name: Build
-        run: npm run build
-
-      - name: Setup Pages
-        uses: actions/configure-pages@v4
-
-      - name: Upload artifact
-        uses: actions/upload-pages-artifact@v3
-        with:
-          path: out
-
-      - name: Deploy to GitHub Pages
-        id: deployment
-        uses: actions/deploy-pages@v4
-'''
+    """Get workflow content (UTF-8 bytes) based on project type."""
 
-    else:
+    if project_type not in PROJECT_TYPES:
         raise ValueError(f"Unknown project type: {project_type}")
 
-    return workflow
+    workflow = _WORKFLOWS[project_type]
+    if isinstance(workflow, bytes):
+        return workflow
+
+    prefix, suffix = workflow
+    return prefix + repo_name.encode("utf-8") + suffix
 
 
 def create_workflow(project_type, repo_name, output_path=None):
@@ -239,9 +148,8 @@ def create_workflow(project_type, repo_name, output_path=None):
     # Get workflow template
     workflow = get_workflow_template(project_type, repo_name)
 
-    # Write workflow file
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(workflow)
+    # Write workflow file in one shot, skipping the buffered-IO wrapper
+    output_path.write_bytes(workflow)
 
     print(f"[OK] Created GitHub Actions workflow at: {output_path}")
     return output_path
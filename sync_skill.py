@@ -3,144 +3,380 @@
 Sync script to copy the github-pages-deploy-skill folder to .claude/skills directory.
 """
 
+import argparse
+import functools
+import hashlib
+import logging
 import os
 import sys
 import shutil
+import tarfile
+import time
+import traceback
+import zstandard as zstd
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
 
+logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+log = logging.getLogger("sync")
 
+
+@functools.lru_cache(maxsize=1)
 def get_paths():
     """Get source and destination paths."""
-    project_dir = Path(__file__).parent.absolute()
+    project_dir = Path(__file__).resolve().parent
     source_folder = project_dir / "github-pages-deploy-skill"
-    skills_dir = Path.home() / ".claude" / "skills"
+    skills_dir = Path.home().joinpath(".claude", "skills")
     dest_folder = skills_dir / "github-pages-deploy-skill"
 
     return project_dir, source_folder, dest_folder, skills_dir
 
 
-def backup_skill(dest_folder):
+def _stat_or_none(path):
+    """Return os.stat for path, or None if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _reflink_copy(src, dst, size):
+    """Copy file contents, letting the kernel reflink on CoW filesystems."""
+    remaining = size
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while remaining > 0:
+                written = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if written == 0:
+                    break
+                remaining -= written
+    except OSError:
+        remaining = size
+    if remaining:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _fast_copytree(src, dst, hardlink=False):
+    """Recursively copy a tree, reflinking (or hardlinking) files when possible."""
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                _fast_copytree(entry.path, target, hardlink)
+            elif entry.is_file(follow_symlinks=False):
+                if hardlink:
+                    os.link(entry.path, target)
+                else:
+                    _reflink_copy(entry.path, target, entry.stat().st_size)
+
+
+def backup_skill(dest_folder, hardlink=False, timestamp=None):
     """Create a backup of the existing skill folder before overwriting."""
-    if not dest_folder.exists():
-        print("[INFO] No existing skill folder found, skipping backup")
+    if _stat_or_none(dest_folder) is None:
+        log.info("[INFO] No existing skill folder found, skipping backup")
         return None
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_path = dest_folder.parent / f"{dest_folder.name}_backup_{timestamp}"
 
     try:
-        shutil.copytree(dest_folder, backup_path)
-        print(f"[OK] Created backup: {backup_path}")
+        # Hardlink backups are near-instant but share inodes with the live
+        # copy, so they are opt-in; the default path lets the kernel reflink
+        _fast_copytree(dest_folder, backup_path, hardlink=hardlink)
+        log.info(f"[OK] Created backup: {backup_path}")
         return backup_path
     except Exception as e:
-        print(f"[ERROR] Failed to create backup: {e}")
+        log.info(f"[ERROR] Failed to create backup: {e}")
         return None
 
 
+def _copy_file(src, dst):
+    """Copy one file with its metadata."""
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _sync_tree(source_folder, dest_folder):
+    """Mirror source into dest, copying only new or changed files."""
+    to_copy = []
+    unchanged = 0
+    created_dirs = set()
+    wanted = set()
+
+    for root, dirs, files in os.walk(source_folder):
+        # Never install compiled bytecode alongside the skill sources
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        rel_root = Path(root).relative_to(source_folder)
+        for name in files:
+            src = Path(root) / name
+            rel = rel_root / name
+            dst = dest_folder / rel
+            wanted.add(rel)
+
+            # Skip files whose size and mtime match the destination
+            src_stat = src.stat()
+            try:
+                dst_stat = dst.stat()
+            except FileNotFoundError:
+                dst_stat = None
+            if dst_stat is not None and (
+                src_stat.st_size == dst_stat.st_size
+                and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+            ):
+                unchanged += 1
+                continue
+
+            # Create parent dirs serially (cheap) so copies never race mkdir
+            parent = dst.parent
+            if parent not in created_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(parent)
+            to_copy.append((src, dst))
+
+    # Fan the copies out across threads to overlap read/write syscalls
+    if to_copy:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_copy_file, src, dst) for src, dst in to_copy]
+            for future in as_completed(futures):
+                future.result()
+    copied = len(to_copy)
+
+    # Remove files (and emptied directories) no longer in the source
+    if _stat_or_none(dest_folder) is not None:
+        for root, dirs, files in os.walk(dest_folder, topdown=False):
+            rel_root = Path(root).relative_to(dest_folder)
+            for name in files:
+                if rel_root / name not in wanted:
+                    (Path(root) / name).unlink()
+            for name in dirs:
+                subdir = Path(root) / name
+                if not any(subdir.iterdir()):
+                    subdir.rmdir()
+
+    return copied, unchanged
+
+
 def sync_skill_folder(source_folder, dest_folder):
     """Copy skill folder to destination."""
-    if not source_folder.exists():
-        print(f"[ERROR] Source folder not found: {source_folder}")
+    if _stat_or_none(source_folder) is None:
+        log.info(f"[ERROR] Source folder not found: {source_folder}")
         return False
 
     # Create destination directory if it doesn't exist
     dest_folder.parent.mkdir(parents=True, exist_ok=True)
 
-    # Remove existing destination folder
-    if dest_folder.exists():
-        print(f"[INFO] Removing existing skill folder: {dest_folder}")
-        shutil.rmtree(dest_folder)
-
-    # Copy the folder
+    # Copy only files that are new or changed since the last sync
     try:
-        shutil.copytree(source_folder, dest_folder)
-        print(f"[OK] Copied {source_folder}")
-        print(f"[OK] To {dest_folder}")
+        copied, unchanged = _sync_tree(source_folder, dest_folder)
+        log.info(f"[OK] Copied {source_folder}")
+        log.info(f"[OK] To {dest_folder}")
+        log.info(f"[OK] Files copied: {copied}, unchanged: {unchanged}")
 
         # Show skill info
         total_size = sum(f.stat().st_size for f in dest_folder.rglob("*") if f.is_file())
-        print(f"[OK] Total size: {total_size / 1024:.1f} KB")
+        log.info(f"[OK] Total size: {total_size / 1024:.1f} KB")
 
         return True
 
     except Exception as e:
-        print(f"[ERROR] Failed to copy skill folder: {e}")
+        log.info(f"[ERROR] Failed to copy skill folder: {e}")
+        return False
+
+
+def _scandir_files(top):
+    """Yield a DirEntry for every file under top, using cached stat info."""
+    stack = [str(top)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    # Keep compiled bytecode out of the packaged skill
+                    if entry.name != "__pycache__":
+                        stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def package_skill(dest_folder):
+    """Package the synced skill folder into a zstd-compressed .skill tarball."""
+    package_path = dest_folder.parent / f"{dest_folder.name.removesuffix('-skill')}.skill"
+    prefix_len = len(str(dest_folder)) + len(os.sep)
+
+    try:
+        # Stream tar -> zstd -> 1 MiB buffered writer; mode='w|' avoids the
+        # seek-back header pass, and USTAR skips PAX header records
+        cctx = zstd.ZstdCompressor(level=3, threads=-1)
+        with open(package_path, "wb", buffering=1 << 20) as raw:
+            with cctx.stream_writer(raw) as zf:
+                with tarfile.open(
+                    fileobj=zf, mode="w|", bufsize=10240 * 16, format=tarfile.USTAR_FORMAT
+                ) as tar:
+                    # Read each member in 1 MiB chunks instead of the 8 KiB default
+                    tar.copybufsize = 1 << 20
+                    for entry in _scandir_files(dest_folder):
+                        tar.add(entry.path, arcname=entry.path[prefix_len:])
+
+        log.info(f"[OK] Created package: {package_path}")
+        log.info(f"[OK] Package size: {package_path.stat().st_size / 1024:.1f} KB")
+        return package_path
+
+    except Exception as e:
+        log.info(f"[ERROR] Failed to package skill: {e}")
+        return None
+
+
+def _sha256_file(path):
+    """Hash a file's contents in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def update_project_package(package_path, project_dir):
+    """Copy the packaged .skill file back into the project directory."""
+    dest_package = project_dir / package_path.name
+
+    try:
+        # Skip the copy when the destination already has identical content:
+        # size + mtime match is proof enough, otherwise fall back to hashing
+        src_stat = os.stat(package_path)
+        dst_stat = _stat_or_none(dest_package)
+        if dst_stat is not None and src_stat.st_size == dst_stat.st_size:
+            if (src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+                    or _sha256_file(package_path) == _sha256_file(dest_package)):
+                log.info(f"[SKIP] Package unchanged: {dest_package}")
+                return True
+
+        shutil.copy2(package_path, dest_package)
+        log.info(f"[OK] Updated project package: {dest_package}")
+        return True
+    except Exception as e:
+        log.info(f"[ERROR] Failed to update project package: {e}")
         return False
 
 
 def show_summary(project_dir, skills_dir, success):
     """Show sync summary."""
-    print("\n" + "=" * 60)
-    print("SYNC SUMMARY")
-    print("=" * 60)
-    print(f"Project directory: {project_dir}")
-    print(f"Skills directory:  {skills_dir}")
-    print(f"Status:            {'SUCCESS' if success else 'FAILED'}")
-    print("=" * 60)
+    log.info("\n" + "=" * 60)
+    log.info("SYNC SUMMARY")
+    log.info("=" * 60)
+    log.info(f"Project directory: {project_dir}")
+    log.info(f"Skills directory:  {skills_dir}")
+    log.info(f"Status:            {'SUCCESS' if success else 'FAILED'}")
+    log.info("=" * 60)
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Sync the github-pages-deploy-skill folder to .claude/skills"
+    )
+    parser.add_argument("-y", "--yes", action="store_true",
+                        help="skip the confirmation prompt (for CI)")
+    parser.add_argument("--no-backup", action="store_true",
+                        help="skip backing up the existing skill folder")
+    parser.add_argument("--hardlink-backup", action="store_true",
+                        help="hardlink backup files instead of copying them")
+    parser.add_argument("--no-package", action="store_true",
+                        help="skip packaging the skill into a .skill tarball")
+    parser.add_argument("--dest",
+                        help="destination skills directory (default: ~/.claude/skills)")
+    return parser.parse_args()
 
 
 def main():
     """Main sync function."""
-    print("\n" + "=" * 60)
-    print("GitHub Pages Deployment Skill - Sync Tool")
-    print("Copying to .claude/skills directory")
-    print("=" * 60 + "\n")
+    args = parse_args()
+
+    # One timestamp per run, shared by every backup this sync creates
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+
+    log.info("\n" + "=" * 60)
+    log.info("GitHub Pages Deployment Skill - Sync Tool")
+    log.info("Copying to .claude/skills directory")
+    log.info("=" * 60 + "\n")
 
     # Get paths
     project_dir, source_folder, dest_folder, skills_dir = get_paths()
+    if args.dest:
+        skills_dir = Path(args.dest)
+        dest_folder = skills_dir / source_folder.name
 
-    print(f"Project directory: {project_dir}")
-    print(f"Source folder:     {source_folder}")
-    print(f"Skills directory:  {skills_dir}\n")
+    log.info(f"Project directory: {project_dir}")
+    log.info(f"Source folder:     {source_folder}")
+    log.info(f"Skills directory:  {skills_dir}\n")
 
     # Check if source exists
     if not source_folder.exists():
-        print(f"[ERROR] Source folder not found: {source_folder}")
+        log.info(f"[ERROR] Source folder not found: {source_folder}")
         sys.exit(1)
 
-    # Ask for confirmation
-    print("[WARNING] This will copy skill folder to .claude/skills directory")
-    print("[INFO] A backup will be created automatically.\n")
+    # Ask for confirmation unless running headless
+    if not args.yes:
+        log.info("[WARNING] This will copy skill folder to .claude/skills directory")
+        log.info("[INFO] A backup will be created automatically.\n")
 
-    response = input("Continue? (y/n): ").strip().lower()
-    if response not in ['y', 'yes']:
-        print("[INFO] Sync cancelled.")
-        sys.exit(0)
+        response = input("Continue? (y/n): ").strip().lower()
+        if response not in ['y', 'yes']:
+            log.info("[INFO] Sync cancelled.")
+            sys.exit(0)
 
     # Step 1: Backup existing skill
-    print("\n[STEP 1] Creating backup...")
-    backup = backup_skill(dest_folder)
+    if args.no_backup:
+        log.info("\n[STEP 1] Skipping backup (--no-backup)")
+        backup = None
+    else:
+        log.info("\n[STEP 1] Creating backup...")
+        backup = backup_skill(dest_folder, hardlink=args.hardlink_backup,
+                              timestamp=timestamp)
 
     # Step 2: Copy skill folder
-    print("\n[STEP 2] Copying skill folder...")
+    log.info("\n[STEP 2] Copying skill folder...")
     success = sync_skill_folder(source_folder, dest_folder)
 
     if not success:
-        print("\n[ERROR] Sync failed! Please check the error messages above.")
+        log.info("\n[ERROR] Sync failed! Please check the error messages above.")
         sys.exit(1)
 
+    # Steps 3/4: Package skill and refresh the copy kept in the project
+    if args.no_package:
+        log.info("\n[STEP 3] Skipping packaging (--no-package)")
+    else:
+        log.info("\n[STEP 3] Packaging skill...")
+        package = package_skill(dest_folder)
+
+        if package:
+            log.info("\n[STEP 4] Updating project package...")
+            update_project_package(package, project_dir)
+
     # Show summary
     show_summary(project_dir, skills_dir, success)
 
     if backup:
-        print(f"\n[INFO] Backup saved to: {backup}")
-        print("[INFO] You can restore it if something goes wrong.")
+        log.info(f"\n[INFO] Backup saved to: {backup}")
+        log.info("[INFO] You can restore it if something goes wrong.")
 
-    print("\n[NEXT STEPS]")
-    print("1. Restart Claude Code to reload the skill")
-    print("2. Test the skill by asking: 'deploy to GitHub Pages'")
-    print("3. If something is wrong, restore from backup\n")
+    log.info("\n[NEXT STEPS]")
+    log.info("1. Restart Claude Code to reload the skill")
+    log.info("2. Test the skill by asking: 'deploy to GitHub Pages'")
+    log.info("3. If something is wrong, restore from backup\n")
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print("\n\n[INFO] Sync cancelled by user.")
+        log.info("\n\n[INFO] Sync cancelled by user.")
         sys.exit(0)
     except Exception as e:
-        print(f"\n[ERROR] Unexpected error: {e}")
-        import traceback
+        log.info(f"\n[ERROR] Unexpected error: {e}")
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        logging.shutdown()